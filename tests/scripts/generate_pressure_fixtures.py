@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Generate O1280 pressure fixtures for the e2e tests.
+
+Writes tests/fixtures/pressure-low-high.bin: mean sea-level pressure with a
+low/high pair near Greenwich (low 10N/10E, high 10S/10W) and an
+opposite-polarity pair near the dateline (high 10N/170E, low 10S/170W),
+plus light noise so contour rendering has something to chew on.
+
+Regenerated output is byte-identical to the committed fixture.
+
+Usage:
+    python tests/scripts/generate_pressure_fixtures.py [out-dir]
+"""
+
+import os
+import sys
+
+import numpy as np
+
+from o1280_grid import O1280_POINTS, generate_gaussian_grid
+
+BASE_PRESSURE = 101_200.0   # Pa
+PRESSURE_DELTA = 3_600.0    # Pa, center anomaly
+LOW_PRESSURE = 97_600.0     # Pa, clamp floor (BASE - DELTA)
+HIGH_PRESSURE = 104_800.0   # Pa, clamp ceiling (BASE + DELTA)
+SIGMA = 0.25                # radians, Gaussian falloff radius
+NOISE_AMPLITUDE = 100.0     # Pa, uniform noise half-range
+
+# (lat, lon, signed delta) for each center
+CENTERS = [
+    (10.0, 10.0, -PRESSURE_DELTA),     # low, Greenwich side
+    (-10.0, -10.0, +PRESSURE_DELTA),   # high, Greenwich side
+    (10.0, 170.0, +PRESSURE_DELTA),    # high, dateline side
+    (-10.0, -170.0, -PRESSURE_DELTA),  # low, dateline side
+]
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), '..', 'fixtures')
+
+
+def tangent_distance2(lats: np.ndarray, lons: np.ndarray,
+                      lat0: float, lon0: float) -> np.ndarray:
+    """Squared tangent-plane distance (radians) from every grid point to (lat0, lon0)."""
+    dlon = (lons - lon0 + np.pi) % (2.0 * np.pi) - np.pi
+    dx = dlon * np.cos(lats)
+    dy = lats - lat0
+    return dx * dx + dy * dy
+
+
+def generate_pressure(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Base pressure + Gaussian anomalies + noise."""
+    # Stack squared distances to every center and take one big exp instead
+    # of a transcendental pass per center. exp is elementwise, so summing
+    # the centers in order afterwards keeps the accumulation - and the
+    # committed fixture bytes - identical.
+    dist2 = np.empty((len(CENTERS), O1280_POINTS))
+    for k, (lat_deg, lon_deg, _) in enumerate(CENTERS):
+        dist2[k] = tangent_distance2(lats, lons,
+                                     np.deg2rad(lat_deg), np.deg2rad(lon_deg))
+    influence = np.exp(-dist2 / (2.0 * SIGMA * SIGMA))
+
+    acc = np.zeros(O1280_POINTS)
+    for (_, _, delta), inf in zip(CENTERS, influence):
+        acc += delta * inf
+    data = BASE_PRESSURE + acc
+
+    # Legacy RandomState so the stream reproduces the committed fixture.
+    rng = np.random.RandomState(42)
+    data += rng.uniform(-NOISE_AMPLITUDE, NOISE_AMPLITUDE, O1280_POINTS)
+    np.clip(data, LOW_PRESSURE, HIGH_PRESSURE, out=data)
+    return data.astype(np.float32)
+
+
+def main() -> None:
+    out_dir = sys.argv[1] if len(sys.argv) > 1 else FIXTURES_DIR
+    lats, lons = generate_gaussian_grid()
+    data = generate_pressure(lats, lons)
+
+    path = os.path.join(out_dir, 'pressure-low-high.bin')
+    data.tofile(path)  # no tobytes() copy of the 26.4 MB buffer
+    print(f'{path}: {data.size} points, '
+          f'[{data.min():.0f}, {data.max():.0f}] Pa')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Generate the uniform-value O1280 .bin fixtures for the e2e tests.
+
+Each fixture is a single value repeated over all 6.6M points, so there is
+nothing to compute: the file is created as a float32 memmap and filled in
+place - no 26.4 MB heap array, no copy through a write() call.
+
+Usage:
+    python tests/scripts/generate_test_bins.py [out-dir]
+"""
+
+import os
+import sys
+
+import numpy as np
+
+from o1280_grid import O1280_POINTS
+
+FIXTURES = {
+    'uniform-55.bin': 55.0,      # degrees C, temp layer
+    'uniform-minus20.bin': -20.0,  # degrees C, temp layer
+}
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), '..', 'fixtures')
+
+
+def write_uniform(path: str, value: float) -> None:
+    out = np.memmap(path, dtype=np.float32, mode='w+', shape=(O1280_POINTS,))
+    out.fill(np.float32(value))
+    out.flush()
+
+
+def main() -> None:
+    out_dir = sys.argv[1] if len(sys.argv) > 1 else FIXTURES_DIR
+    for name, value in FIXTURES.items():
+        path = os.path.join(out_dir, name)
+        write_uniform(path, value)
+        print(f'{path}: {O1280_POINTS} x {value}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Generate O1280 wind fixtures for the e2e tests.
+
+Writes tests/fixtures/wind-cyclone-u.bin and wind-cyclone-v.bin: a clockwise
+vortex centered at 0N/0E whose speed ramps linearly to MAX_WIND at the core
+radius and decays linearly back to calm at the outer radius, with a slight
+inflow toward the center so the particle layer shows a clean spiral.
+
+Regenerated output matches the committed fixtures to within float32
+rounding (under 1e-5 m/s).
+
+Usage:
+    python tests/scripts/generate_wind_fixtures.py [out-dir]
+"""
+
+import os
+import sys
+
+import numpy as np
+
+from o1280_grid import generate_gaussian_grid
+
+MAX_WIND = 26.1         # m/s at the core radius
+CORE_RADIUS = 0.1       # radians; speed ramps up linearly to here
+OUTER_RADIUS = 0.8      # radians; calm beyond this distance
+INFLOW_RATIO = 0.3      # radial (inward) fraction of the tangential flow
+INFLOW_NORM = 1.044     # hypot(1, INFLOW_RATIO), keeps |(u, v)| == speed
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), '..', 'fixtures')
+
+
+def generate_cyclone(lats: np.ndarray, lons: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Clockwise vortex at 0N/0E: returns (u, v) in m/s."""
+    # Local tangent-plane coordinates relative to the center (radians).
+    # float32 throughout - matches the fixture dtype and halves bandwidth.
+    dlon = np.where(lons > np.pi, lons - np.float32(2.0 * np.pi), lons)
+    dx = dlon * np.cos(lats)
+    dy = np.asarray(lats)
+    r = np.sqrt(dx * dx + dy * dy)
+
+    # Piecewise-linear profile: ramp to MAX_WIND at CORE_RADIUS, linear
+    # decay to 0 at OUTER_RADIUS. Branchless: each clipped factor saturates
+    # at 1 inside the regime where the other one is active, so the product
+    # selects the right line and is calm outside OUTER_RADIUS.
+    speed = (MAX_WIND
+             * np.clip(r / CORE_RADIUS, 0.0, 1.0)
+             * np.clip((OUTER_RADIUS - r) / (OUTER_RADIUS - CORE_RADIUS), 0.0, 1.0))
+
+    # Clockwise tangential flow (dy, -dx)/r plus INFLOW_RATIO of radial
+    # inflow (-dx, -dy)/r, scaled back to unit magnitude by INFLOW_NORM.
+    with np.errstate(invalid='ignore', divide='ignore'):
+        u = np.where(r > 0.0, speed / INFLOW_NORM / r * (dy - INFLOW_RATIO * dx), 0.0)
+        v = np.where(r > 0.0, speed / INFLOW_NORM / r * (-dx - INFLOW_RATIO * dy), 0.0)
+    return u.astype(np.float32), v.astype(np.float32)
+
+
+def main() -> None:
+    out_dir = sys.argv[1] if len(sys.argv) > 1 else FIXTURES_DIR
+    lats, lons = generate_gaussian_grid()
+    u, v = generate_cyclone(lats, lons)
+
+    for name, comp in (('wind-cyclone-u.bin', u), ('wind-cyclone-v.bin', v)):
+        path = os.path.join(out_dir, name)
+        with open(path, 'wb') as f:
+            f.write(comp.tobytes())
+        print(f'{path}: {comp.size} points, '
+              f'[{comp.min():.2f}, {comp.max():.2f}] m/s')
+
+
+if __name__ == '__main__':
+    main()
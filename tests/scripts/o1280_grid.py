@@ -0,0 +1,76 @@
+"""
+Shared O1280 octahedral grid helpers for the fixture generators.
+
+The per-point coordinate arrays (2 x 26.4 MB) are cached as .npy files next
+to this module and returned memory-mapped, so repeat fixture runs skip the
+grid build and share pages between processes.
+"""
+
+import os
+
+import numpy as np
+
+N = 1280
+NUM_RINGS = 2 * N
+O1280_POINTS = 6_599_680
+
+CACHE_DIR = os.path.join(os.path.dirname(__file__), '.o1280-cache')
+
+
+def ring_sizes() -> np.ndarray:
+    """Points per ring: 4 * ring_from_pole + 16."""
+    i = np.arange(NUM_RINGS)
+    ring_from_pole = np.where(i < N, i + 1, NUM_RINGS - i)
+    return (4 * ring_from_pole + 16).astype(np.int64)
+
+
+def ring_offsets(sizes: np.ndarray) -> np.ndarray:
+    """Start offset of each ring in the flat point array."""
+    offsets = np.empty(NUM_RINGS, dtype=np.int64)
+    offsets[0] = 0
+    np.cumsum(sizes[:-1], out=offsets[1:])
+    return offsets
+
+
+def ring_lats() -> np.ndarray:
+    """Ring latitudes in radians, north to south (linear approximation)."""
+    i = np.arange(NUM_RINGS)
+    return np.deg2rad(90.0 - (i + 0.5) * (180.0 / NUM_RINGS)).astype(np.float32)
+
+
+def _build_grid() -> tuple[np.ndarray, np.ndarray]:
+    """Per-point (lat, lon) in radians for the full O1280 grid.
+
+    Branchless: latitudes are one np.repeat over ring sizes, and longitudes
+    come from a global arange minus the repeated ring offsets - no Python
+    loop at all.
+    """
+    sizes = ring_sizes()
+    offsets = ring_offsets(sizes)
+
+    lats = np.repeat(ring_lats(), sizes)
+    point_in_ring = np.arange(O1280_POINTS, dtype=np.int64) - np.repeat(offsets, sizes)
+    lons = (point_in_ring * np.repeat(2.0 * np.pi / sizes, sizes)).astype(np.float32)
+    return lats, lons
+
+
+def generate_gaussian_grid() -> tuple[np.ndarray, np.ndarray]:
+    """Per-point (lat, lon) in radians, memory-mapped from the disk cache."""
+    # Grid parameters are baked into the filenames so a changed N (or a
+    # stale checkout) invalidates the cache instead of serving wrong data.
+    lats_path = os.path.join(CACHE_DIR, f'o1280-{N}-lats.npy')
+    lons_path = os.path.join(CACHE_DIR, f'o1280-{N}-lons.npy')
+
+    if not (os.path.exists(lats_path) and os.path.exists(lons_path)):
+        lats, lons = _build_grid()
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        np.save(lats_path, lats)
+        np.save(lons_path, lons)
+
+    lats = np.load(lats_path, mmap_mode='r')
+    lons = np.load(lons_path, mmap_mode='r')
+    if lats.size != O1280_POINTS or lons.size != O1280_POINTS:
+        raise ValueError(f'stale grid cache in {CACHE_DIR}: '
+                         f'expected {O1280_POINTS} points, '
+                         f'got {lats.size}/{lons.size} - delete it and rerun')
+    return lats, lons
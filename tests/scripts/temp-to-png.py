@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Render a temperature fixture (raw float32 O1280 .bin, degrees C) as a
+colormapped equirectangular PNG using the app's temp palette.
+
+Colormap and byte-packing are fused into one pass: values quantize to a
+uint8 index and a single 256x3 LUT gather produces the RGB image - no
+per-pixel Python and no float RGB intermediate.
+
+Usage:
+    python tests/scripts/temp-to-png.py <input.bin> <output.png>
+"""
+
+import json
+import os
+import sys
+
+import numpy as np
+from PIL import Image
+
+from o1280_grid import NUM_RINGS, O1280_POINTS, ring_lats, ring_offsets, ring_sizes
+
+WIDTH = 1024
+HEIGHT = 512
+
+PALETTE_PATH = os.path.join(os.path.dirname(__file__), '..', '..',
+                            'public', 'images', 'palettes', 'temp-classic.json')
+
+
+def reproject(data: np.ndarray, lats: np.ndarray, offsets: np.ndarray,
+              sizes: np.ndarray) -> np.ndarray:
+    """Sample the O1280 field onto a (HEIGHT, WIDTH) equirectangular grid."""
+    lat = (0.5 - (np.arange(HEIGHT) + 0.5) / HEIGHT) * np.pi
+    lon = (np.arange(WIDTH) + 0.5) / WIDTH * 2.0 * np.pi - np.pi
+
+    row_ring = np.searchsorted(-lats, -lat).clip(max=NUM_RINGS - 1)
+    # sizes is a precomputed LUT - a gather instead of ring-from-pole math
+    n_points = sizes[row_ring][:, None]
+
+    lon_norm = np.where(lon >= 0.0, lon, lon + 2.0 * np.pi)[None, :]
+    lon_idx = (lon_norm / (2.0 * np.pi) * n_points).astype(np.int64) % n_points
+
+    return data[offsets[row_ring][:, None] + lon_idx]
+
+
+def build_lut() -> tuple[np.ndarray, float, float]:
+    """256x3 uint8 LUT over the palette's value range (non-interpolating)."""
+    with open(PALETTE_PATH) as f:
+        palette = json.load(f)
+    stops = palette['stops']
+    values = np.array([s['value'] for s in stops], dtype=np.float64)
+    colors = np.array([s['color'] for s in stops], dtype=np.uint8)
+
+    vmin, vmax = values[0], values[-1]
+    lut_values = vmin + np.arange(256) / 255.0 * (vmax - vmin)
+    band = np.searchsorted(values, lut_values, side='right') - 1
+    return colors[band.clip(0, len(stops) - 1)], float(vmin), float(vmax)
+
+
+def main() -> None:
+    if len(sys.argv) != 3:
+        print(__doc__.strip(), file=sys.stderr)
+        sys.exit(1)
+
+    data = np.fromfile(sys.argv[1], dtype=np.float32)
+    if data.size != O1280_POINTS:
+        print(f'Expected {O1280_POINTS} float32 values, got {data.size}', file=sys.stderr)
+        sys.exit(1)
+
+    sizes = ring_sizes()
+    values = reproject(data, ring_lats(), ring_offsets(sizes), sizes)
+    fahrenheit = values * 1.8 + 32.0  # palette stops are in F, fixtures in C
+
+    lut, vmin, vmax = build_lut()
+    index = np.clip((fahrenheit - vmin) / (vmax - vmin) * 255.0, 0, 255).astype(np.uint8)
+    rgb = lut[index]
+
+    Image.fromarray(rgb, 'RGB').save(sys.argv[2])
+    print(f'{sys.argv[2]}: {WIDTH}x{HEIGHT}, '
+          f'[{fahrenheit.min():.1f}, {fahrenheit.max():.1f}] F')
+
+
+if __name__ == '__main__':
+    main()
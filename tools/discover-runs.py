@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Discover available Open-Meteo model runs and timesteps from S3.
+
+Command-line twin of src/services/timestep-service.ts discovery: finds the
+first and newest runs, expands the 6-hourly run list, and merges valid
+times into the deduplicated timestep list the app would see. Useful for
+checking bucket state and debugging data gaps without starting the app.
+
+Usage:
+    python tools/discover-runs.py [--model ecmwf_ifs] [--verify N]
+"""
+
+import argparse
+import json
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from io import BytesIO
+from typing import NamedTuple
+from urllib.parse import quote
+from urllib.request import Request, urlopen
+from xml.etree.ElementTree import iterparse
+
+BUCKET_ROOT = 'https://openmeteo.s3.amazonaws.com'
+RUN_INTERVAL_HOURS = 6
+GAP_FILL_HOURS = range(6)  # first 6 hours of older runs fill gaps
+
+RUN_RE = re.compile(r'/(\d{4})/(\d{2})/(\d{2})/(\d{4})Z/$')
+
+
+class Runs(NamedTuple):
+    """Model runs as parallel columns (SoA) - cheap to scan and slice."""
+    prefixes: list[str]
+    datetimes: list[datetime]
+    names: list[str]
+
+
+class Timesteps(NamedTuple):
+    """Timesteps as parallel columns (SoA) - cheap to scan and slice."""
+    timesteps: list[str]
+    runs: list[str]
+    urls: list[str]
+
+
+def http_get(url: str) -> bytes:
+    req = Request(url, headers={'User-Agent': 'zero-discover-runs'})
+    with urlopen(req, timeout=30) as resp:
+        return resp.read()
+
+
+def _list_s3(prefix: str, delimited: bool) -> list[str]:
+    """List an S3 prefix, following continuation tokens past 1000 entries.
+
+    Parsed with streaming iterparse instead of building a DOM - elements are
+    consumed and cleared as they close.
+    """
+    results: list[str] = []
+    token: str | None = None
+    while True:
+        url = f'{BUCKET_ROOT}/?list-type=2&prefix={quote(prefix)}'
+        if delimited:
+            url += '&delimiter=/'
+        if token:
+            url += f'&continuation-token={quote(token)}'
+
+        truncated = False
+        token = None
+        in_common_prefixes = False
+        for event, elem in iterparse(BytesIO(http_get(url)), events=('start', 'end')):
+            tag = elem.tag.rsplit('}', 1)[-1]
+            if event == 'start':
+                in_common_prefixes |= tag == 'CommonPrefixes'
+                continue
+            if tag == 'CommonPrefixes':
+                in_common_prefixes = False
+            elif tag == 'Prefix' and delimited and in_common_prefixes and elem.text:
+                results.append(elem.text)
+            elif tag == 'Key' and not delimited and elem.text:
+                results.append(elem.text)
+            elif tag == 'IsTruncated':
+                truncated = elem.text == 'true'
+            elif tag == 'NextContinuationToken':
+                token = elem.text
+            elem.clear()
+
+        if not (truncated and token):
+            return sorted(results)
+
+
+def list_s3_prefixes(prefix: str) -> list[str]:
+    """List immediate child prefixes ("directories") under an S3 prefix."""
+    return _list_s3(prefix, delimited=True)
+
+
+def list_s3_files(prefix: str) -> list[str]:
+    """List object keys under an S3 prefix."""
+    return _list_s3(prefix, delimited=False)
+
+
+def parse_run_prefix(prefix: str) -> datetime | None:
+    match = RUN_RE.search(prefix)
+    if not match:
+        return None
+    year, month, day, hhmm = match.groups()
+    return datetime(int(year), int(month), int(day),
+                    int(hhmm[:2]), int(hhmm[2:]), tzinfo=timezone.utc)
+
+
+def discover_run_bounds(base_prefix: str, pool: ThreadPoolExecutor):
+    """Find the oldest and newest run in the bucket (a handful of listings).
+
+    The per-month and per-day listings are independent, so they are issued
+    concurrently on the pool instead of one round-trip at a time.
+    """
+    now = datetime.now(timezone.utc)
+    week_ago = now - timedelta(days=7)
+    months = {f'{base_prefix}{t.year}/{t.month:02d}/' for t in (week_ago, now)}
+
+    day_prefixes = sorted(
+        day for days in pool.map(list_s3_prefixes, sorted(months)) for day in days
+    )
+    if not day_prefixes:
+        return None, None, None
+
+    oldest_f = pool.submit(list_s3_prefixes, day_prefixes[0])
+    newest_f = pool.submit(list_s3_prefixes, day_prefixes[-1])
+    oldest_day_runs = oldest_f.result()
+    newest_day_runs = newest_f.result()
+
+    first_run = parse_run_prefix(oldest_day_runs[0]) if oldest_day_runs else None
+    newest_run = parse_run_prefix(newest_day_runs[-1]) if newest_day_runs else None
+    newest_prefix = newest_day_runs[-1] if newest_day_runs else None
+    return first_run, newest_run, newest_prefix
+
+
+def generate_runs(base_prefix: str, first_run: datetime, last_run: datetime) -> Runs:
+    """Expand the 6-hourly run list between the first and last run."""
+    runs = Runs([], [], [])
+    cursor = first_run
+    while cursor <= last_run:
+        run_time = f'{cursor.hour:02d}00Z'
+        runs.prefixes.append(f'{base_prefix}{cursor.year}/{cursor.month:02d}/'
+                             f'{cursor.day:02d}/{run_time}/')
+        runs.datetimes.append(cursor)
+        runs.names.append(run_time)
+        cursor += timedelta(hours=RUN_INTERVAL_HOURS)
+    return runs
+
+
+def format_timestep(dt: datetime) -> str:
+    return dt.strftime('%Y-%m-%dT%H%M')
+
+
+# Fixed-layout dates: slicing digits out directly skips strptime's format
+# parsing, which dominates when run over thousands of valid_times.
+
+def parse_valid_time(iso: str) -> datetime:
+    """Parse 'YYYY-MM-DDTHH:MM[:SS[Z]]'."""
+    return datetime(int(iso[0:4]), int(iso[5:7]), int(iso[8:10]),
+                    int(iso[11:13]), int(iso[14:16]), tzinfo=timezone.utc)
+
+
+def parse_timestep(ts: str) -> datetime:
+    """Parse 'YYYY-MM-DDTHHMM'."""
+    return datetime(int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+                    int(ts[11:13]), int(ts[13:15]), tzinfo=timezone.utc)
+
+
+def generate_timesteps(runs: Runs, completed_run_time: datetime,
+                       completed_valid_times: list[str],
+                       incomplete_prefix: str | None,
+                       incomplete_timesteps: list[str]) -> Timesteps:
+    """Merge timesteps from newest to oldest run, newest run wins."""
+    out = Timesteps([], [], [])
+    # Dedup on integer epoch seconds: int hashing beats string hashing and
+    # duplicates are dropped before any timestep string is formatted.
+    seen: set[int] = set()
+
+    def add(dt: datetime, run: str, prefix: str, ts: str | None = None) -> None:
+        epoch = int(dt.timestamp())
+        if epoch in seen:
+            return
+        seen.add(epoch)
+        if ts is None:
+            ts = format_timestep(dt)
+        out.timesteps.append(ts)
+        out.runs.append(run)
+        out.urls.append(f'{BUCKET_ROOT}/{prefix}{ts}.om')
+
+    if incomplete_prefix:
+        run_match = re.search(r'/(\d{4}Z)/$', incomplete_prefix)
+        run_time = run_match.group(1) if run_match else 'unknown'
+        for ts in incomplete_timesteps:
+            add(parse_timestep(ts), run_time, incomplete_prefix, ts)
+
+    for i in range(len(runs.prefixes) - 1, -1, -1):
+        if runs.datetimes[i] == completed_run_time:
+            for iso in completed_valid_times:
+                add(parse_valid_time(iso), runs.names[i], runs.prefixes[i])
+        else:
+            for hours in GAP_FILL_HOURS:
+                add(runs.datetimes[i] + timedelta(hours=hours),
+                    runs.names[i], runs.prefixes[i])
+
+    order = sorted(range(len(out.timesteps)), key=out.timesteps.__getitem__)
+    return Timesteps([out.timesteps[i] for i in order],
+                     [out.runs[i] for i in order],
+                     [out.urls[i] for i in order])
+
+
+def _head_exists(url: str) -> bool:
+    req = Request(url, method='HEAD', headers={'User-Agent': 'zero-discover-runs'})
+    try:
+        with urlopen(req, timeout=30):
+            return True
+    except OSError:
+        return False
+
+
+def verify_timesteps(timesteps: Timesteps, count: int) -> int:
+    """HEAD the newest `count` timestep URLs; returns how many exist.
+
+    Requests are latency-bound, so they run as a thread-pooled batch
+    instead of one round-trip at a time.
+    """
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        exists = list(pool.map(_head_exists, timesteps.urls[-count:]))
+    for ts, run, ok in zip(timesteps.timesteps[-count:], timesteps.runs[-count:], exists):
+        if not ok:
+            print(f'  missing: {ts} ({run})')
+    return sum(exists)
+
+
+def discover_runs(model: str, verify: int) -> Timesteps:
+    base_prefix = f'data_spatial/{model}/'
+
+    latest = json.loads(http_get(f'{BUCKET_ROOT}/{base_prefix}latest.json'))
+    completed_run_time = parse_valid_time(latest['reference_time'])
+    completed_valid_times = latest.get('valid_times', [])
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        first_run, newest_run, newest_prefix = discover_run_bounds(base_prefix, pool)
+    if first_run is None:
+        sys.exit(f'No runs found for {model}')
+
+    incomplete_prefix = None
+    incomplete_timesteps: list[str] = []
+    if newest_run and newest_run > completed_run_time:
+        incomplete_prefix = newest_prefix
+        incomplete_timesteps = [
+            m.group(1)
+            for f in list_s3_files(newest_prefix)
+            if (m := re.search(r'(\d{4}-\d{2}-\d{2}T\d{4})\.om$', f))
+        ]
+
+    last_complete = completed_run_time if incomplete_prefix else (newest_run or completed_run_time)
+    runs = generate_runs(base_prefix, first_run, last_complete)
+    timesteps = generate_timesteps(runs, completed_run_time, completed_valid_times,
+                                   incomplete_prefix, incomplete_timesteps)
+
+    print(f'{model}: {len(runs.prefixes)} runs '
+          f'({format_timestep(first_run)} - {format_timestep(last_complete)}), '
+          f'{len(timesteps.timesteps)} timesteps')
+    if incomplete_prefix:
+        print(f'incomplete run: {incomplete_prefix} ({len(incomplete_timesteps)} timesteps)')
+    if verify:
+        ok = verify_timesteps(timesteps, verify)
+        print(f'verified: {ok}/{min(verify, len(timesteps.timesteps))} newest timesteps exist')
+    return timesteps
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--model', default='ecmwf_ifs')
+    parser.add_argument('--verify', type=int, default=0, metavar='N',
+                        help='HEAD the N newest timestep URLs')
+    args = parser.parse_args()
+    discover_runs(args.model, args.verify)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Render a decoded O1280 field (raw float32 .bin) as an equirectangular PNG.
+
+Debug tool for eyeballing decoded Open-Meteo data outside the renderer.
+
+O1280 octahedral reduced Gaussian grid (see src/render/gaussian-grid.ts):
+- 2560 latitude rings, ring 0 at the north pole
+- 4 * ring_from_pole + 16 points per ring (20 at the poles, 5136 at the equator)
+- 6,599,680 points total, stored ring by ring
+
+Usage:
+    python tools/temp-to-png.py <input.bin> <output.png>
+"""
+
+import sys
+
+import numpy as np
+from PIL import Image
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional - NumPy fallback below
+    njit = prange = None
+
+N = 1280
+NUM_RINGS = 2 * N
+O1280_POINTS = 6_599_680
+
+WIDTH = 1024
+HEIGHT = 512
+
+
+def generate_gaussian_lats() -> np.ndarray:
+    """Ring latitudes in radians, north to south (linear approximation)."""
+    i = np.arange(NUM_RINGS)
+    return np.deg2rad(90.0 - (i + 0.5) * (180.0 / NUM_RINGS)).astype(np.float32)
+
+
+def generate_ring_sizes() -> np.ndarray:
+    """Points per ring: 4 * ring_from_pole + 16."""
+    i = np.arange(NUM_RINGS)
+    ring_from_pole = np.where(i < N, i + 1, NUM_RINGS - i)
+    return (4 * ring_from_pole + 16).astype(np.int64)
+
+
+def generate_ring_offsets(sizes: np.ndarray) -> np.ndarray:
+    """Start offset of each ring in the flat point array."""
+    offsets = np.empty(NUM_RINGS, dtype=np.int64)
+    offsets[0] = 0
+    np.cumsum(sizes[:-1], out=offsets[1:])
+    return offsets
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _render_numba(data, lats, offsets, sizes, dmin, scale):
+        # Fused gather + normalize + quantize: emits the uint8 image
+        # directly, no float (HEIGHT, WIDTH) intermediate.
+        out = np.empty((HEIGHT, WIDTH), dtype=np.uint8)
+        two_pi = 2.0 * np.pi
+        for y in prange(HEIGHT):
+            lat = (0.5 - (y + 0.5) / HEIGHT) * np.pi
+            # Binary search the (descending) ring latitudes
+            lo, hi = 0, NUM_RINGS - 1
+            while lo < hi:
+                mid = (lo + hi) >> 1
+                if lats[mid] > lat:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            ring = lo
+            n_points = sizes[ring]
+            base = offsets[ring]
+            for x in range(WIDTH):
+                lon = (x + 0.5) / WIDTH * two_pi - np.pi
+                if lon < 0.0:
+                    lon += two_pi
+                lon_idx = int(lon / two_pi * n_points) % n_points
+                v = (data[base + lon_idx] - dmin) * scale
+                if not v >= 0.0:  # also catches NaN
+                    v = 0.0
+                elif v > 255.0:
+                    v = 255.0
+                out[y, x] = np.uint8(v)
+        return out
+
+
+def _reproject_numpy(data: np.ndarray, lats: np.ndarray, offsets: np.ndarray,
+                     sizes: np.ndarray) -> np.ndarray:
+    """Sample the O1280 field onto a (HEIGHT, WIDTH) equirectangular grid.
+
+    Fully vectorized: one batched binary search for the ring of every pixel,
+    then a single fancy-index gather - no per-pixel Python.
+    """
+    lat = (0.5 - (np.arange(HEIGHT) + 0.5) / HEIGHT) * np.pi
+    lon = (np.arange(WIDTH) + 0.5) / WIDTH * 2.0 * np.pi - np.pi
+
+    # Output latitudes and ring latitudes are both monotonically decreasing,
+    # so a single merge walk finds every row's ring in O(HEIGHT + NUM_RINGS)
+    # instead of a binary search per pixel.
+    row_ring = np.empty(HEIGHT, dtype=np.int32)
+    r = 0
+    for y in range(HEIGHT):
+        while r < NUM_RINGS - 1 and lats[r] > lat[y]:
+            r += 1
+        row_ring[y] = r
+
+    # Every pixel in a row shares its ring; sizes is a precomputed LUT, so
+    # this is a gather rather than per-row ring-from-pole arithmetic.
+    n_points = sizes[row_ring][:, None]
+
+    lon_norm = np.where(lon >= 0.0, lon, lon + 2.0 * np.pi)[None, :]
+    lon_idx = (lon_norm / (2.0 * np.pi) * n_points).astype(np.int64) % n_points
+
+    return data[offsets[row_ring][:, None] + lon_idx]
+
+
+def render_gray(data: np.ndarray, lats: np.ndarray, offsets: np.ndarray,
+                sizes: np.ndarray, dmin: float, drange: float) -> np.ndarray:
+    """Render the normalized 8-bit image, fused in one numba kernel when available."""
+    if njit is not None:
+        return _render_numba(data, lats, offsets, sizes, dmin, 255.0 / drange)
+    values = _reproject_numpy(data, lats, offsets, sizes)
+    return np.clip((values - dmin) / drange * 255.0, 0, 255).astype(np.uint8)
+
+
+def main() -> None:
+    if len(sys.argv) != 3:
+        print(__doc__.strip(), file=sys.stderr)
+        sys.exit(1)
+
+    data = np.fromfile(sys.argv[1], dtype=np.float32)
+    if data.size != O1280_POINTS:
+        print(f'Expected {O1280_POINTS} float32 values, got {data.size}', file=sys.stderr)
+        sys.exit(1)
+
+    lats = generate_gaussian_lats()
+    sizes = generate_ring_sizes()
+    offsets = generate_ring_offsets(sizes)
+
+    # Normalize over the full field so the scale doesn't depend on which
+    # points the raster happens to sample.
+    dmin = float(np.nanmin(data))
+    dmax = float(np.nanmax(data))
+    drange = (dmax - dmin) or 1.0
+    gray = render_gray(data, lats, offsets, sizes, dmin, drange)
+
+    Image.fromarray(gray, 'L').save(sys.argv[2])
+    print(f'{sys.argv[2]}: {WIDTH}x{HEIGHT}, range [{dmin:.2f}, {dmax:.2f}]')
+
+
+if __name__ == '__main__':
+    main()